@@ -96,22 +96,25 @@ def read(file: Union[str, Tensor], convert_to_backend=True) -> SampledField:
 
 
 def read_single_field(file: str, convert_to_backend=True) -> SampledField:
-    stored = np.load(file, allow_pickle=True)
-    ftype = stored['field_type']
-    implemented_types = ('CenteredGrid', 'StaggeredGrid')
-    if ftype in implemented_types:
+    with np.load(file, allow_pickle=True) as stored:  # each stored[key] access decompresses that entry, so read every entry once
+        ftype = stored['field_type']
+        implemented_types = ('CenteredGrid', 'StaggeredGrid')
+        if ftype not in implemented_types:
+            raise NotImplementedError(f"{ftype} not implemented ({implemented_types})")
         data_arr = stored['data']
         dim_item_names = stored.get('dim_item_names', (None,) * len(data_arr.shape))
-        data = tensor(data_arr, Shape(data_arr.shape, tuple(stored['dim_names']), tuple(stored['dim_types']), tuple(dim_item_names)), convert=convert_to_backend)
+        dim_names, dim_types = stored['dim_names'], stored['dim_types']
         bounds_item_names = stored.get('bounds_item_names', None)
-        if bounds_item_names is None or bounds_item_names.shape == ():  # None or empty array
-            bounds_item_names = spatial(data).names
-        lower = wrap(stored['lower'], channel(vector=tuple(bounds_item_names))) if stored['lower'].ndim > 0 else wrap(stored['lower'])
-        upper = wrap(stored['upper'], channel(vector=tuple(bounds_item_names)))
-        extr = extrapolation.from_dict(stored['extrapolation'][()])
-        if ftype == 'CenteredGrid':
-            return CenteredGrid(data, bounds=geom.Box(lower, upper), extrapolation=extr)
-        elif ftype == 'StaggeredGrid':
-            data_ = unstack_staggered_tensor(data, extr)
-            return StaggeredGrid(data_, bounds=geom.Box(lower, upper), extrapolation=extr)
-    raise NotImplementedError(f"{ftype} not implemented ({implemented_types})")
+        lower_arr, upper_arr = stored['lower'], stored['upper']
+        extrapolation_dict = stored['extrapolation'][()]
+    data = tensor(data_arr, Shape(data_arr.shape, tuple(dim_names), tuple(dim_types), tuple(dim_item_names)), convert=convert_to_backend)
+    if bounds_item_names is None or bounds_item_names.shape == ():  # None or empty array
+        bounds_item_names = spatial(data).names
+    lower = wrap(lower_arr, channel(vector=tuple(bounds_item_names))) if lower_arr.ndim > 0 else wrap(lower_arr)
+    upper = wrap(upper_arr, channel(vector=tuple(bounds_item_names)))
+    extr = extrapolation.from_dict(extrapolation_dict)
+    if ftype == 'CenteredGrid':
+        return CenteredGrid(data, bounds=geom.Box(lower, upper), extrapolation=extr)
+    else:
+        data_ = unstack_staggered_tensor(data, extr)
+        return StaggeredGrid(data_, bounds=geom.Box(lower, upper), extrapolation=extr)
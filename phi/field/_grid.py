@@ -264,11 +264,12 @@ class CenteredGrid(Grid, metaclass=deprecated_field_class('CenteredGrid', parent
         assert math.all_available(bounds.lower, bounds.upper), "Shift resampling requires 'bounds' to be available."
         lower = math.to_int32(math.ceil(math.maximum(0, self.box.lower - bounds.lower) / self.dx - threshold))
         upper = math.to_int32(math.ceil(math.maximum(0, bounds.upper - self.box.upper) / self.dx - threshold))
-        total_padding = (math.sum(lower) + math.sum(upper)).numpy()
+        total_padding = math.sum(lower + upper).numpy()
         if total_padding > max_padding and self.extrapolation.native_grid_sample_mode:
             return NotImplemented
         elif total_padding > 0:
             from phi.field import pad
+            lower, upper = lower.numpy('vector'), upper.numpy('vector')  # fetch all widths at once instead of one scalar per dim
             padded = pad(self, {dim: (int(lower[i]), int(upper[i])) for i, dim in enumerate(self.shape.spatial.names)})
             grid_box, grid_resolution, grid_values = padded.box, padded.resolution, padded.values
         else:
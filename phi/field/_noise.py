@@ -46,10 +46,9 @@ class Noise(Field):
         k_vec = math.fftfreq(resolution) * resolution / math.tensor(size) * math.tensor(self.scale)  # in physical units
         k2 = math.vec_squared(k_vec)
         lowest_frequency = 0.1
-        weight_mask = math.to_float(k2 > lowest_frequency)
         inv_k2 = math.divide_no_nan(1, k2)
         # --- Compute result ---
-        fft = rndj * inv_k2 ** self.smoothness * weight_mask
+        fft = rndj * math.where(k2 > lowest_frequency, inv_k2 ** self.smoothness, 0)
         array = math.real(math.ifft(fft))
         array /= math.std(array, dim=array.shape.non_batch)
         array -= math.mean(array, dim=array.shape.non_batch)
@@ -37,15 +37,17 @@ def get_fieldnames(simpath) -> tuple:
 
 
 def get_frames(path: str, field_name: str = None, mode=set.intersection) -> tuple:
+    files = [_str(f) for f in os.listdir(path) if _str(f).endswith(".npz")]
     if field_name is not None:
-        all_frames = {int(f[-10:-4]) for f in os.listdir(path) if _str(f).startswith(field_name) and _str(f).endswith(".npz")}
+        all_frames = {int(f[-10:-4]) for f in files if f[:-11] == field_name}
         return tuple(sorted(all_frames))
     else:
-        fields = get_fieldnames(path)
-        if not fields:
+        frames_by_field = {}
+        for f in files:  # single directory listing for all fields
+            frames_by_field.setdefault(f[:-11], set()).add(int(f[-10:-4]))
+        if not frames_by_field:
             return ()
-        frames_sets = [set(get_frames(path, field)) for field in fields]
-        frames = mode(*frames_sets)
+        frames = mode(*frames_by_field.values())
         return tuple(sorted(frames))
 
 
@@ -6,6 +6,7 @@ import phi
 from phi import math
 from phi import field
 from phi.field import Scene, CenteredGrid, StaggeredGrid
+from phi.field._scene import get_frames
 from phiml.math import batch, extrapolation, wrap, stack, vec
 
 DIR = join(dirname(dirname(dirname(dirname(abspath(__file__))))), 'test_data')
@@ -84,6 +85,15 @@ class TestScene(TestCase):
         self.assertGreaterEqual(scene_.shape.volume, 2)
         scene.remove()
 
+    def test_frames_prefix_field_names(self):
+        scene = Scene.create(DIR)
+        scene.write(vel=CenteredGrid(0, x=4), velocity=CenteredGrid(0, x=4), frame=0)
+        scene.write(velocity=CenteredGrid(0, x=4), frame=1)
+        self.assertEqual((0, 1), scene.frames)
+        self.assertEqual((0,), scene.complete_frames)
+        self.assertEqual((0,), get_frames(scene.path, 'vel'))
+        scene.remove()
+
     def test_write_read(self):
         smoke = CenteredGrid(1, extrapolation.BOUNDARY, x=32, y=32)
         vel = StaggeredGrid(2, 0, x=32, y=32)